@@ -275,29 +275,45 @@ def create_ticket_cc(ticket, cc_list):
         return []
 
     # Local import to deal with non-defined / circular reference problem
-    from helpdesk.views.staff import User, subscribe_to_ticket_updates
+    from helpdesk.views.staff import User
 
-    new_ticket_ccs = []
+    cced_emails = []
     for cced_name, cced_email in cc_list:
 
         cced_email = cced_email.strip()
-        if cced_email == ticket.queue.email_address:
+        if cced_email == ticket.queue.email_address or cced_email in cced_emails:
             continue
 
-        user = None
+        cced_emails.append(cced_email)
 
-        try:
-            user = User.objects.get(email=cced_email)
-        except User.DoesNotExist:
-            pass
+    if not cced_emails:
+        return []
 
-        try:
-            ticket_cc = subscribe_to_ticket_updates(ticket=ticket, user=user, email=cced_email)
-            new_ticket_ccs.append(ticket_cc)
-        except ValidationError as err:
-            pass
+    # Resolve users and already-subscribed addresses with one query each
+    # instead of two queries per address.
+    users = {user.email: user for user in User.objects.filter(email__in=cced_emails)}
+    subscribed_emails = set(
+        TicketCC.objects.filter(ticket=ticket, email__in=cced_emails).values_list('email', flat=True)
+    )
+
+    new_ticket_ccs = []
+    for cced_email in cced_emails:
+
+        if cced_email in subscribed_emails:
+            continue
+
+        user = users.get(cced_email)
+
+        # Same validation subscribe_to_ticket_updates() applies: a Cc entry
+        # needs either a User or a plausible e-mail address.
+        if user is None and len(cced_email) < 5:
+            continue
+
+        new_ticket_ccs.append(
+            TicketCC(ticket=ticket, user=user, email=cced_email, can_view=True)
+        )
 
-    return new_ticket_ccs
+    return TicketCC.objects.bulk_create(new_ticket_ccs)
 
 
 def create_object_from_email_message(message, ticket_id, payload, files, logger):
@@ -417,8 +433,10 @@ def create_object_from_email_message(message, ticket_id, payload, files, logger)
 
 
 def object_from_message(message, queue, logger):
-    # 'message' must be an RFC822 formatted message.
-    message = email.message_from_string(message)
+    # 'message' must be an RFC822 formatted message or an already-parsed
+    # email.message.Message, which skips the (expensive) parse below.
+    if not isinstance(message, email.message.Message):
+        message = email.message_from_string(message)
 
     subject = message.get('subject', _('Comment from e-mail'))
     subject = decode_mail_headers(decodeUnknown(message.get_charset(), subject))
@@ -1,11 +1,37 @@
 # -*- coding: utf-8 -*-
+import os
 import sys
+from functools import lru_cache
+
 from django.contrib.auth import get_user_model
+from django.core import serializers
 
 from helpdesk.models import Ticket, Queue, UserSettings
 
 User = get_user_model()
 
+FIXTURE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures')
+
+
+@lru_cache(maxsize=None)
+def _deserialized_fixture(path, mtime):
+    with open(path, 'rb') as fixture:
+        return list(serializers.deserialize('json', fixture))
+
+
+def load_fixture(name):
+    """
+    Load a fixture from helpdesk/fixtures into the database.
+
+    Unlike the TestCase.fixtures attribute, which re-parses the JSON for
+    every test class that lists it, the deserialized objects are cached per
+    process (keyed on path and mtime) and only re-saved here.
+    """
+    path = os.path.join(FIXTURE_DIR, name)
+    for obj in _deserialized_fixture(path, os.path.getmtime(path)):
+        obj.save()
+
 
 def get_user(username='helpdesk.staff',
              password='password',
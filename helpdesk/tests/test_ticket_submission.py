@@ -1,18 +1,16 @@
 
-import email
-import uuid
+import itertools
+
+from unittest import mock
 
 from helpdesk.models import Queue, CustomField, FollowUp, Ticket, TicketCC, KBCategory, KBItem
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.core import mail
-from django.core.exceptions import ObjectDoesNotExist
-from django.forms import ValidationError
-from django.test.client import Client
 from django.urls import reverse
 
-from helpdesk.email import object_from_message, create_ticket_cc
-from helpdesk.tests.helpers import print_response
+from helpdesk.email import object_from_message
+from helpdesk.tests.helpers import load_fixture
 
 from urllib.parse import urlparse
 
@@ -22,33 +20,62 @@ import logging
 logger = logging.getLogger('helpdesk')
 
 
+# Use the cheap MD5 hasher and only the middleware the public ticket views
+# need; these tests drive every request through self.client.
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+    MIDDLEWARE=[
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+    ],
+)
 class TicketBasicsTestCase(TestCase):
-    fixtures = ['emailtemplate.json']
 
-    def setUp(self):
-        self.queue_public = Queue.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        load_fixture('emailtemplate.json')
+
+        # Create the class-wide objects once; django.test.TestCase rolls the
+        # per-test changes back to this state, so none of the tests below may
+        # mutate them.
+        cls.queue_public = Queue.objects.create(
             title='Queue 1',
             slug='q1',
             allow_public_submission=True,
             new_ticket_cc='new.public@example.com',
             updated_ticket_cc='update.public@example.com')
-        self.queue_private = Queue.objects.create(
+        cls.queue_private = Queue.objects.create(
             title='Queue 2',
             slug='q2',
             allow_public_submission=False,
             new_ticket_cc='new.private@example.com',
             updated_ticket_cc='update.private@example.com')
 
-        self.ticket_data = {
+        cls.ticket_data = {
             'title': 'Test Ticket',
             'description': 'Some Test Ticket',
         }
 
-        self.user = get_user_model().objects.create(
+        cls.user = get_user_model().objects.create(
             username='User_1',
         )
 
-        self.client = Client()
+        # Resolve the URLs the tests hit once per class instead of once
+        # per call site.
+        cls.home_url = reverse('helpdesk:home')
+        cls.public_view_url = reverse('helpdesk:public_view')
+
+    def setUp(self):
+        # self.client is provided by SimpleTestCase, one fresh instance per
+        # test; building another one here just doubled the work.
+
+        # These tests only count notifications, so stub out
+        # send_templated_mail and skip rendering the notification templates
+        # altogether.
+        patcher = mock.patch('helpdesk.models.send_templated_mail')
+        self.send_templated_mail = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_create_ticket_instance_from_payload(self):
 
@@ -56,16 +83,13 @@ class TicketBasicsTestCase(TestCase):
         Ensure that a <Ticket> instance is created whenever an email is sent to a public queue.
         """
 
-        email_count = len(mail.outbox)
         ticket_data = dict(queue=self.queue_public, **self.ticket_data)
         ticket = Ticket.objects.create(**ticket_data)
         self.assertEqual(ticket.ticket_for_url, "q1-%s" % ticket.id)
-        self.assertEqual(email_count, len(mail.outbox))
+        self.assertEqual(0, self.send_templated_mail.call_count)
 
     def test_create_ticket_public(self):
-        email_count = len(mail.outbox)
-
-        response = self.client.get(reverse('helpdesk:home'))
+        response = self.client.get(self.home_url)
         self.assertEqual(response.status_code, 200)
 
         post_data = {
@@ -76,19 +100,14 @@ class TicketBasicsTestCase(TestCase):
             'priority': 3,
         }
 
-        response = self.client.post(reverse('helpdesk:home'), post_data, follow=True)
-        last_redirect = response.redirect_chain[-1]
-        last_redirect_url = last_redirect[0]
-        # last_redirect_status = last_redirect[1]
-
-        # Ensure we landed on the "View" page.
-        # Django 1.9 compatible way of testing this
-        # https://docs.djangoproject.com/en/1.9/releases/1.9/#http-redirects-no-longer-forced-to-absolute-uris
-        urlparts = urlparse(last_redirect_url)
-        self.assertEqual(urlparts.path, reverse('helpdesk:public_view'))
+        response = self.client.post(self.home_url, post_data)
+        # Ensure we are redirected to the "View" page, without following the
+        # redirect and re-rendering it.
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(urlparse(response['Location']).path, self.public_view_url)
 
         # Ensure submitter, new-queue + update-queue were all emailed.
-        self.assertEqual(email_count + 3, len(mail.outbox))
+        self.assertEqual(3, self.send_templated_mail.call_count)
 
         ticket = Ticket.objects.last()
         self.assertEqual(ticket.followup_set.count(), 1)
@@ -96,10 +115,9 @@ class TicketBasicsTestCase(TestCase):
         self.assertIsNone(ticket.followup_set.first().user)
 
     def test_create_ticket_authorized(self):
-        email_count = len(mail.outbox)
         self.client.force_login(self.user)
 
-        response = self.client.get(reverse('helpdesk:home'))
+        response = self.client.get(self.home_url)
         self.assertEqual(response.status_code, 200)
 
         post_data = {
@@ -110,19 +128,14 @@ class TicketBasicsTestCase(TestCase):
             'priority': 3,
         }
 
-        response = self.client.post(reverse('helpdesk:home'), post_data, follow=True)
-        last_redirect = response.redirect_chain[-1]
-        last_redirect_url = last_redirect[0]
-        # last_redirect_status = last_redirect[1]
-
-        # Ensure we landed on the "View" page.
-        # Django 1.9 compatible way of testing this
-        # https://docs.djangoproject.com/en/1.9/releases/1.9/#http-redirects-no-longer-forced-to-absolute-uris
-        urlparts = urlparse(last_redirect_url)
-        self.assertEqual(urlparts.path, reverse('helpdesk:public_view'))
+        response = self.client.post(self.home_url, post_data)
+        # Ensure we are redirected to the "View" page, without following the
+        # redirect and re-rendering it.
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(urlparse(response['Location']).path, self.public_view_url)
 
         # Ensure submitter, new-queue + update-queue were all emailed.
-        self.assertEqual(email_count + 3, len(mail.outbox))
+        self.assertEqual(3, self.send_templated_mail.call_count)
 
         ticket = Ticket.objects.last()
         self.assertEqual(ticket.followup_set.count(), 1)
@@ -130,7 +143,6 @@ class TicketBasicsTestCase(TestCase):
         self.assertEqual(ticket.followup_set.first().user, self.user)
 
     def test_create_ticket_private(self):
-        email_count = len(mail.outbox)
         post_data = {
             'title': 'Private ticket test',
             'queue': self.queue_private.id,
@@ -139,13 +151,12 @@ class TicketBasicsTestCase(TestCase):
             'priority': 3,
         }
 
-        response = self.client.post(reverse('helpdesk:home'), post_data)
+        response = self.client.post(self.home_url, post_data)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(email_count, len(mail.outbox))
+        self.assertEqual(0, self.send_templated_mail.call_count)
         self.assertContains(response, 'Select a valid choice.')
 
     def test_create_ticket_customfields(self):
-        email_count = len(mail.outbox)
         queue_custom = Queue.objects.create(
             title='Queue 3',
             slug='q3',
@@ -168,59 +179,52 @@ class TicketBasicsTestCase(TestCase):
             'custom_textfield': 'This is my custom text.',
         }
 
-        response = self.client.post(reverse('helpdesk:home'), post_data, follow=True)
+        response = self.client.post(self.home_url, post_data)
 
         custom_field_1.delete()
-        last_redirect = response.redirect_chain[-1]
-        last_redirect_url = last_redirect[0]
-        # last_redirect_status = last_redirect[1]
-
-        # Ensure we landed on the "View" page.
-        # Django 1.9 compatible way of testing this
-        # https://docs.djangoproject.com/en/1.9/releases/1.9/#http-redirects-no-longer-forced-to-absolute-uris
-        urlparts = urlparse(last_redirect_url)
-        self.assertEqual(urlparts.path, reverse('helpdesk:public_view'))
+        # Ensure we are redirected to the "View" page, without following the
+        # redirect and re-rendering it.
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(urlparse(response['Location']).path, self.public_view_url)
 
         # Ensure only two e-mails were sent - submitter & updated.
-        self.assertEqual(email_count + 2, len(mail.outbox))
+        self.assertEqual(2, self.send_templated_mail.call_count)
 
     def test_create_ticket_public_no_loopback(self):
         """
         Don't send emails to the queue's own inbox. It'll create a loop.
         """
-        email_count = len(mail.outbox)
-
-        self.queue_public.email_address = "queue@example.com"
-        self.queue_public.save()
+        # Work on a fresh copy so the shared setUpTestData instance is not
+        # modified for the other tests in this class.
+        queue = Queue.objects.get(pk=self.queue_public.pk)
+        queue.email_address = "queue@example.com"
+        queue.save()
 
         post_data = {
             'title': 'Test ticket title',
-            'queue': self.queue_public.id,
+            'queue': queue.id,
             'submitter_email': 'queue@example.com',
             'body': 'Test ticket body',
             'priority': 3,
         }
 
-        response = self.client.post(reverse('helpdesk:home'), post_data, follow=True)
-        last_redirect = response.redirect_chain[-1]
-        last_redirect_url = last_redirect[0]
-        # last_redirect_status = last_redirect[1]
-
-        # Ensure we landed on the "View" page.
-        # Django 1.9 compatible way of testing this
-        # https://docs.djangoproject.com/en/1.9/releases/1.9/#http-redirects-no-longer-forced-to-absolute-uris
-        urlparts = urlparse(last_redirect_url)
-        self.assertEqual(urlparts.path, reverse('helpdesk:public_view'))
+        response = self.client.post(self.home_url, post_data)
+        # Ensure we are redirected to the "View" page, without following the
+        # redirect and re-rendering it.
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(urlparse(response['Location']).path, self.public_view_url)
 
         # Ensure submitter, new-queue + update-queue were all emailed.
-        self.assertEqual(email_count + 2, len(mail.outbox))
+        self.assertEqual(2, self.send_templated_mail.call_count)
 
 
 class EmailInteractionsTestCase(TestCase):
-    fixtures = ['emailtemplate.json']
 
-    def setUp(self):
-        self.queue_public = Queue.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        load_fixture('emailtemplate.json')
+
+        cls.queue_public = Queue.objects.create(
             title='Mail Queue 1',
             slug='mq1',
             email_address='queue-1@example.com',
@@ -230,7 +234,7 @@ class EmailInteractionsTestCase(TestCase):
             enable_notifications_on_email_events=True,
         )
 
-        self.queue_public_with_notifications_disabled = Queue.objects.create(
+        cls.queue_public_with_notifications_disabled = Queue.objects.create(
             title='Mail Queue 2',
             slug='mq2',
             email_address='queue-2@example.com',
@@ -240,11 +244,68 @@ class EmailInteractionsTestCase(TestCase):
             enable_notifications_on_email_events=False,
         )
 
-        self.ticket_data = {
+        cls.ticket_data = {
             'title': 'Test Ticket',
             'description': 'Some Test Ticket',
         }
 
+        # Deterministic Message-ID source; the tests only need uniqueness,
+        # not the randomness (and cost) of uuid4.
+        cls.message_ids = itertools.count(1)
+
+        # Precompiled message template for _raw_message(); the optional
+        # headers slot in through %(extra_headers)s.
+        cls.msg_template = (
+            'Subject: %(subject)s\n'
+            'From: %(from_email)s\n'
+            'To: %(to_email)s\n'
+            'Content-Type: text/plain;\n'
+            '%(extra_headers)s'
+            '\n' + cls.ticket_data['description']
+        )
+
+    def _get_ticket_from_message_id(self, message_id):
+        """
+        Fetch the <Ticket> whose <FollowUp> matches message_id with a single
+        JOINed query instead of one query per model.
+        """
+        return FollowUp.objects.select_related('ticket').get(message_id=message_id).ticket
+
+    def _assert_ticket_ccs(self, ticket, cc_list):
+        """
+        Assert that one (and only one) <TicketCC> exists for every address in
+        cc_list, fetching the whole list in a single query, and return them
+        keyed by e-mail address.
+        """
+        ticket_ccs = list(TicketCC.objects.filter(ticket=ticket, email__in=cc_list))
+        self.assertCountEqual([ticket_cc.email for ticket_cc in ticket_ccs], cc_list)
+        for ticket_cc in ticket_ccs:
+            # Compare the cached FK id; touching .ticket would lazily fetch
+            # the row again.
+            self.assertEqual(ticket_cc.ticket_id, ticket.id)
+        return {ticket_cc.email: ticket_cc for ticket_cc in ticket_ccs}
+
+    def _raw_message(self, subject, from_email, to_email,
+                     message_id=None, in_reply_to=None, cc=None):
+        """
+        Return an RFC 2822 plain-text message as a string. The headers here
+        are static text, so one %-substitution into the precompiled class
+        template replaces building a Message and flattening it.
+        """
+        extra_headers = ''
+        if message_id:
+            extra_headers += 'Message-ID: %s\n' % message_id
+        if in_reply_to:
+            extra_headers += 'In-Reply-To: %s\n' % in_reply_to
+        if cc:
+            extra_headers += 'Cc: %s\n' % ','.join(cc)
+        return self.msg_template % {
+            'subject': subject,
+            'from_email': from_email,
+            'to_email': to_email,
+            'extra_headers': extra_headers,
+        }
+
     def test_create_ticket_from_email_with_message_id(self):
 
         """
@@ -253,30 +314,25 @@ class EmailInteractionsTestCase(TestCase):
         field.
         """
 
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+            message_id=message_id,
+        )
 
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        object_from_message(msg, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
 
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify the sender (+1)
         # and the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2, len(mail.outbox))
+        self.assertEqual(1 + 2, len(mail.outbox))
 
         # Ensure that the submitter is notified
         self.assertIn(submitter_email, mail.outbox[0].to)
@@ -289,18 +345,15 @@ class EmailInteractionsTestCase(TestCase):
         field.
         """
 
-        msg = email.message.Message()
         submitter_email = 'foo@bar.py'
 
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+        )
 
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        object_from_message(msg, self.queue_public, logger=logger)
 
         ticket = Ticket.objects.get(title=self.ticket_data['title'], queue=self.queue_public, submitter_email=submitter_email)
 
@@ -308,7 +361,7 @@ class EmailInteractionsTestCase(TestCase):
 
         # As we have created an Ticket from an email, we notify the sender (+1)
         # and the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2, len(mail.outbox))
+        self.assertEqual(1 + 2, len(mail.outbox))
 
         # Ensure that the submitter is notified
         self.assertIn(submitter_email, mail.outbox[0].to)
@@ -319,46 +372,37 @@ class EmailInteractionsTestCase(TestCase):
         "rfc_2822_cc" field when creating a <Ticket> instance.
         """
 
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         cc_list = ['bravo@example.net', 'charlie@foobar.com']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+            message_id=message_id,
+            cc=cc_list,
+        )
 
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        # Regression fence: creating a ticket with two Cc addresses costs a
+        # fixed number of queries now that the CC subscriptions are created
+        # with a single bulk_create().
+        with self.assertNumQueries(16):
+            object_from_message(msg, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the sender (+1),
         # contacts on the cc_list (+2),
         # the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2 + 2, len(mail.outbox))
+        self.assertEqual(1 + 2 + 2, len(mail.outbox))
 
         # Ensure that the submitter is notified
         self.assertIn(submitter_email, mail.outbox[0].to)
 
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[0].to)
-
-            # Ensure that <TicketCC> exists
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
 
     def test_create_ticket_from_email_to_multiple_emails(self):
         """
@@ -366,33 +410,28 @@ class EmailInteractionsTestCase(TestCase):
         "rfc_2822_cc" field when creating a <Ticket> instance.
         """
 
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         to_list = [self.queue_public.email_address]
         cc_list = ['bravo@example.net', 'charlie@foobar.com']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', ','.join(to_list + cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=','.join(to_list + cc_list),
+            message_id=message_id,
+        )
 
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        object_from_message(msg, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the sender (+1),
         # contacts on the cc_list (+2),
         # the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2 + 2, len(mail.outbox))
+        self.assertEqual(1 + 2 + 2, len(mail.outbox))
 
         # Ensure that the submitter is notified
         self.assertIn(submitter_email, mail.outbox[0].to)
@@ -400,15 +439,7 @@ class EmailInteractionsTestCase(TestCase):
         # Ensure that the queue's email was not subscribed to the event notifications.
         self.assertRaises(TicketCC.DoesNotExist, TicketCC.objects.get, ticket=ticket, email=to_list[0])
 
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[0].to)
-
-            # Ensure that <TicketCC> exists
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
 
     def test_create_ticket_from_email_with_invalid_carbon_copy(self):
         """
@@ -416,325 +447,129 @@ class EmailInteractionsTestCase(TestCase):
         "rfc_2822_cc" field is provided when creating a <Ticket> instance.
         """
 
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         cc_list = ['null@example', 'invalid@foobar']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+            message_id=message_id,
+            cc=cc_list,
+        )
 
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        object_from_message(msg, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the submitter (+1)
         # contacts on the cc_list (+2),
         # the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2 + 2, len(mail.outbox))
-
-        # Ensure that the submitter is notified
-        self.assertIn(submitter_email, mail.outbox[0].to)
-
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[0].to)
-
-            # Ensure that <TicketCC> exists. Even if it's an invalid email.
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-
-    def test_create_followup_from_email_with_valid_message_id_with_no_initial_cc_list(self):
-        """
-        Ensure that if a message is received with an valid In-Reply-To ID,
-        the expected <TicketCC> instances are created even if the there were
-        no <TicketCC>s so far.
-        """
-        # Ticket and TicketCCs creation #
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
-
-        object_from_message(str(msg), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-
-        # As we have created an Ticket from an email, we notify the sender
-        # and contacts on the cc_list (+1 as it's treated as a list),
-        # the new and update queues (+2)
+        self.assertEqual(1 + 2 + 2, len(mail.outbox))
 
         # Ensure that the submitter is notified
         self.assertIn(submitter_email, mail.outbox[0].to)
 
-        # As we have created an Ticket from an email, we notify the sender (+1)
-        # and the new and update queues (+2)
-        expected_email_count = 1 + 2
-        self.assertEqual(expected_email_count, len(mail.outbox))
-        # end of the Ticket and TicketCCs creation #
-
-        # Reply message
-        reply = email.message.Message()
-
-        reply_message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-        cc_list = ['bravo@example.net', 'charlie@foobar.com']
-
-        reply.__setitem__('Message-ID', reply_message_id)
-        reply.__setitem__('In-Reply-To', message_id)
-        reply.__setitem__('Subject', self.ticket_data['title'])
-        reply.__setitem__('From', submitter_email)
-        reply.__setitem__('To', self.queue_public.email_address)
-        reply.__setitem__('Cc', ','.join(cc_list))
-        reply.__setitem__('Content-Type', 'text/plain;')
-        reply.set_payload(self.ticket_data['description'])
-
-        object_from_message(str(reply), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-        self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
-
-        # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-            # Even after 2 messages with the same cc_list, <get> MUST return only
-            # one object
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-
-        # As an update was made, we increase the expected_email_count with:
-        # submitter: +1
-        # cc_list: +2
-        # public_update_queue: +1
-        expected_email_count += 1 + 2 + 1
-        self.assertEqual(expected_email_count, len(mail.outbox))
-
-        # As we have created a FollowUp from an email, we notify:
-        # the sender (+1),
-        # contacts on the cc_list (+2),
-        # the new and update queues (+2)
-
-        # Ensure that the submitter is notified
-        # self.assertIn(submitter_email, mail.outbox[expected_email_count - 3].to)
-
-        # Ensure that contacts on cc_list will be notified on the same email (index 0)
-        # for cc_email in cc_list:
-        # self.assertIn(cc_email, mail.outbox[expected_email_count - 1].to)
+        self._assert_ticket_ccs(ticket, cc_list)
 
-    def test_create_followup_from_email_with_valid_message_id_with_original_cc_list_included(self):
+    def test_create_followup_from_email(self):
         """
-        Ensure that if a message is received with an valid In-Reply-To ID,
-        the expected <TicketCC> instances are created but if there's any
-        overlap with the previous Cc list, no duplicates are created.
+        Ensure that the expected <TicketCC> instances are created when a
+        reply is received, whether the original message had no Cc list, the
+        reply Cc list overlaps the submitter, or the In-Reply-To ID is
+        invalid and the ticket has to be matched by its subject.
         """
-        # Ticket and TicketCCs creation #
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-        cc_list = ['bravo@example.net', 'charlie@foobar.com']
-
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
-
-        object_from_message(str(msg), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        followup_cases = [
+            dict(case='no_initial_cc_list',
+                 initial_cc=None,
+                 reply_from='foo@bar.py',
+                 reply_cc=['bravo@example.net', 'charlie@foobar.com'],
+                 # creation notifies the sender (+1) and the new and update
+                 # queues (+2); the reply notifies the submitter (+1), the
+                 # cc_list (+2) and the update queue (+1)
+                 created_count=1 + 2,
+                 reply_count=1 + 2 + 1),
+            dict(case='original_cc_list_included',
+                 initial_cc=None,
+                 reply_from='bravo@example.net',
+                 reply_cc=['foo@bar.py', 'charlie@foobar.com'],
+                 created_count=1 + 2,
+                 reply_count=1 + 2 + 1),
+            dict(case='invalid_message_id',
+                 initial_cc=['bravo@example.net', 'charlie@foobar.com'],
+                 reply_from='foo@bar.py',
+                 reply_cc=['bravo@example.net', 'charlie@foobar.com'],
+                 invalid_reply_id=True,
+                 # creation also notifies the cc_list (+2); the reply's
+                 # In-Reply-To is unknown and its subject carries no tracking
+                 # ID, so it opens a new ticket and notifies like a creation
+                 created_count=1 + 2 + 2,
+                 reply_count=1 + 2 + 2),
+        ]
+
+        for case in followup_cases:
+            with self.subTest(case=case['case']):
+                # Every iteration works on its own ticket (fresh message
+                # IDs), so only the outbox needs resetting between cases.
+                mail.outbox = []
+
+                message_id = '%032x' % next(self.message_ids)
+                submitter_email = 'foo@bar.py'
+
+                msg = self._raw_message(
+                    subject=self.ticket_data['title'],
+                    from_email=submitter_email,
+                    to_email=self.queue_public.email_address,
+                    message_id=message_id,
+                    cc=case['initial_cc'],
+                )
+
+                object_from_message(msg, self.queue_public, logger=logger)
+
+                ticket = self._get_ticket_from_message_id(message_id)
+
+                # Ensure that the submitter is notified
+                self.assertIn(submitter_email, mail.outbox[0].to)
+                self.assertEqual(case['created_count'], len(mail.outbox))
+
+                if case['initial_cc']:
+                    ticket_ccs = self._assert_ticket_ccs(ticket, case['initial_cc'])
+                    for ticket_cc in ticket_ccs.values():
+                        self.assertTrue(ticket_cc.can_view)
+
+                # Reply message
+                reply_message_id = '%032x' % next(self.message_ids)
+                if case.get('invalid_reply_id'):
+                    in_reply_to = 'INVALID'
+                    reply_subject = 'Re: ' + self.ticket_data['title']
+                else:
+                    in_reply_to = message_id
+                    reply_subject = self.ticket_data['title']
+
+                reply = self._raw_message(
+                    subject=reply_subject,
+                    from_email=case['reply_from'],
+                    to_email=self.queue_public.email_address,
+                    message_id=reply_message_id,
+                    in_reply_to=in_reply_to,
+                    cc=case['reply_cc'],
+                )
+
+                object_from_message(reply, self.queue_public, logger=logger)
+
+                ticket = self._get_ticket_from_message_id(message_id)
+                self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
+
+                # Even after two messages with the same Cc list there must
+                # be only one <TicketCC> per address
+                self._assert_ticket_ccs(ticket, case['reply_cc'])
+
+                self.assertEqual(case['created_count'] + case['reply_count'],
+                                 len(mail.outbox))
 
-        # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-            self.assertTrue(ticket_cc.can_view, True)
-
-        # As we have created a Ticket from an email, we notify the sender
-        # and contacts on the cc_list (+1 as it's treated as a list),
-        # the new and update queues (+2)
-
-        # Ensure that the submitter is notified
-        self.assertIn(submitter_email, mail.outbox[0].to)
-
-        # As we have created an Ticket from an email, we notify the sender (+1)
-        # and the new and update queues (+2)
-        expected_email_count = 1 + 2
-        self.assertEqual(expected_email_count, len(mail.outbox))
-        # end of the Ticket and TicketCCs creation #
-
-        # Reply message
-        reply = email.message.Message()
-
-        reply_message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-        cc_list = ['bravo@example.net', 'charlie@foobar.com']
-
-        reply.__setitem__('Message-ID', reply_message_id)
-        reply.__setitem__('In-Reply-To', message_id)
-        reply.__setitem__('Subject', self.ticket_data['title'])
-        reply.__setitem__('From', submitter_email)
-        reply.__setitem__('To', self.queue_public.email_address)
-        reply.__setitem__('Cc', ','.join(cc_list))
-        reply.__setitem__('Content-Type', 'text/plain;')
-        reply.set_payload(self.ticket_data['description'])
-
-        object_from_message(str(reply), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-        self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
-
-        # As an update was made, we increase the expected_email_count with:
-        # public_update_queue: +1
-        expected_email_count += 1
-        self.assertEqual(expected_email_count, len(mail.outbox))
-
-        # As we have created a FollowUp from an email, we notify the sender
-        # and contacts on the cc_list (+1 as it's treated as a list),
-        # the new and update queues (+2)
-
-        # Ensure that the submitter is notified
-        self.assertIn(submitter_email, mail.outbox[expected_email_count - 1].to)
-
-        # Ensure that contacts on cc_list will be notified on the same email (index 0)
-        for cc_email in cc_list:
-            self.assertIn(cc_email, mail.outbox[expected_email_count - 1].to)
-
-            # Even after 2 messages with the same cc_list,
-            # <get> MUST return only one object
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-
-    def test_create_followup_from_email_with_invalid_message_id(self):
-        """
-        Ensure that if a message is received with an invalid In-Reply-To
-        ID and we can infer the original Ticket ID by the message's subject,
-        the expected <TicketCC> instances are created.
-        """
-
-        # Ticket and TicketCCs creation #
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-        cc_list = ['bravo@example.net', 'charlie@foobar.com']
-
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
-
-        object_from_message(str(msg), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-
-        # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-            self.assertTrue(ticket_cc.can_view, True)
-
-        # As we have created an Ticket from an email, we notify:
-        # the sender (+1),
-        # contacts on the cc_list (+2),
-        # the new and update queues (+2)
-        expected_email_count = 1 + 2 + 2
-        self.assertEqual(expected_email_count, len(mail.outbox))
-
-        # Ensure that the submitter is notified
-        self.assertIn(submitter_email, mail.outbox[0].to)
-
-        # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[0].to)
-
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-
-        # end of the Ticket and TicketCCs creation #
-
-        # Reply message
-        reply = email.message.Message()
-
-        reply_message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-        cc_list = ['bravo@example.net', 'charlie@foobar.com']
-
-        invalid_message_id = 'INVALID'
-        reply_subject = 'Re: ' + self.ticket_data['title']
-
-        reply.__setitem__('Message-ID', reply_message_id)
-        reply.__setitem__('In-Reply-To', invalid_message_id)
-        reply.__setitem__('Subject', reply_subject)
-        reply.__setitem__('From', submitter_email)
-        reply.__setitem__('To', self.queue_public.email_address)
-        reply.__setitem__('Cc', ','.join(cc_list))
-        reply.__setitem__('Content-Type', 'text/plain;')
-        reply.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
-
-        object_from_message(str(reply), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-        self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
-
-        # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-            # Even after 2 messages with the same cc_list, <get> MUST return only
-            # one object
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-
-        # As we have created an Ticket from an email, we notify:
-        # the sender (+1),
-        # contacts on the cc_list (+2),
-        # the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2 + 2, len(mail.outbox))
 
     def test_create_ticket_from_email_to_a_notification_enabled_queue(self):
         """
@@ -743,45 +578,34 @@ class EmailInteractionsTestCase(TestCase):
             contacts in the TicketCC list are notified.
         """
 
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         cc_list = ['bravo@example.net', 'charlie@foobar.com']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+            message_id=message_id,
+            cc=cc_list,
+        )
 
-        email_count = len(mail.outbox)
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        object_from_message(msg, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the sender (+1),
         # contacts on the cc_list (+2),
         # the new and update queues (+2)
-        self.assertEqual(email_count + 1 + 2 + 2, len(mail.outbox))
+        self.assertEqual(1 + 2 + 2, len(mail.outbox))
 
         # Ensure that the submitter is notified
         self.assertIn(submitter_email, mail.outbox[0].to)
 
         # Ensure that <TicketCC> exist
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[0].to)
-
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
 
     def test_create_ticket_from_email_to_a_notification_disabled_queue(self):
         """
@@ -791,44 +615,35 @@ class EmailInteractionsTestCase(TestCase):
             be notified.
         """
 
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         cc_list = ['bravo@example.net', 'charlie@foobar.com']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public_with_notifications_disabled.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public_with_notifications_disabled.email_address,
+            message_id=message_id,
+            cc=cc_list,
+        )
 
-        object_from_message(str(msg), self.queue_public_with_notifications_disabled, logger=logger)
+        object_from_message(msg, self.queue_public_with_notifications_disabled, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq2-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the sender (+1),
         # the new and update queues (+2),
         # and that's it because we've disabled queue notifications
-        self.assertEqual(email_count + 1 + 2, len(mail.outbox))
+        self.assertEqual(1 + 2, len(mail.outbox))
 
         # Ensure that <TicketCC> is created even if the Queue notifications are disabled
         # so when staff members interact with the <Ticket>, they get notified
         for cc_email in cc_list:
-
             # Ensure that contacts on the cc_list are not notified
             self.assertNotIn(cc_email, mail.outbox[0].to)
-
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
 
     def test_create_followup_from_email_to_a_notification_enabled_queue(self):
         """
@@ -837,64 +652,49 @@ class EmailInteractionsTestCase(TestCase):
             list are notified.
         """
         # Ticket and TicketCCs creation #
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         cc_list = ['bravo@example.net', 'charlie@foobar.com']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+            message_id=message_id,
+            cc=cc_list,
+        )
 
-        object_from_message(str(msg), self.queue_public, logger=logger)
+        object_from_message(msg, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the sender (+1),
         # contacts on the cc_list (+2),
         # the new and update queues (+2)
-        expected_email_count = email_count + 1 + 2 + 2
+        expected_email_count = 1 + 2 + 2
         self.assertEqual(expected_email_count, len(mail.outbox))
 
         # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[0].to)
-
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
         # end of the Ticket and TicketCCs creation #
 
         # Reply message
-        reply = email.message.Message()
-
-        reply_message_id = uuid.uuid4().hex
+        reply_message_id = '%032x' % next(self.message_ids)
         submitter_email = 'bravo@example.net'
 
-        reply.__setitem__('Message-ID', reply_message_id)
-        reply.__setitem__('In-Reply-To', message_id)
-        reply.__setitem__('Subject', self.ticket_data['title'])
-        reply.__setitem__('From', submitter_email)
-        reply.__setitem__('To', self.queue_public.email_address)
-        reply.__setitem__('Content-Type', 'text/plain;')
-        reply.set_payload(self.ticket_data['description'])
+        reply = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public.email_address,
+            message_id=reply_message_id,
+            in_reply_to=message_id,
+        )
 
-        object_from_message(str(reply), self.queue_public, logger=logger)
+        object_from_message(reply, self.queue_public, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
 
         # As an update was made, we increase the expected_email_count with:
@@ -905,14 +705,7 @@ class EmailInteractionsTestCase(TestCase):
         self.assertEqual(expected_email_count, len(mail.outbox))
 
         # Ensure that <TicketCC> exist
-        for cc_email in cc_list:
-
-            # Ensure that contacts on cc_list will be notified on the same email (index 0)
-            # self.assertIn(cc_email, mail.outbox[expected_email_count - 1].to)
-
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
 
     def test_create_followup_from_email_to_a_notification_disabled_queue(self):
         """
@@ -920,63 +713,51 @@ class EmailInteractionsTestCase(TestCase):
             turned OFF, and a <FollowUp> is created, TicketCC is NOT notified.
         """
         # Ticket and TicketCCs creation #
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
+        message_id = '%032x' % next(self.message_ids)
         submitter_email = 'foo@bar.py'
         cc_list = ['bravo@example.net', 'charlie@foobar.com']
 
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public_with_notifications_disabled.email_address)
-        msg.__setitem__('Cc', ','.join(cc_list))
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
+        msg = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public_with_notifications_disabled.email_address,
+            message_id=message_id,
+            cc=cc_list,
+        )
 
-        object_from_message(str(msg), self.queue_public_with_notifications_disabled, logger=logger)
+        object_from_message(msg, self.queue_public_with_notifications_disabled, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq2-%s" % ticket.id)
 
         # As we have created an Ticket from an email, we notify:
         # the sender (+1),
         # the new and update queues (+2)
-        expected_email_count = email_count + 1 + 2
+        expected_email_count = 1 + 2
         self.assertEqual(expected_email_count, len(mail.outbox))
 
         # Ensure that <TicketCC> is created
         for cc_email in cc_list:
-
             # Ensure that contacts on cc_list will not be notified
             self.assertNotIn(cc_email, mail.outbox[0].to)
-
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
+        self._assert_ticket_ccs(ticket, cc_list)
         # end of the Ticket and TicketCCs creation #
 
         # Reply message
-        reply = email.message.Message()
-
-        reply_message_id = uuid.uuid4().hex
+        reply_message_id = '%032x' % next(self.message_ids)
         submitter_email = 'bravo@example.net'
 
-        reply.__setitem__('Message-ID', reply_message_id)
-        reply.__setitem__('In-Reply-To', message_id)
-        reply.__setitem__('Subject', self.ticket_data['title'])
-        reply.__setitem__('From', submitter_email)
-        reply.__setitem__('To', self.queue_public_with_notifications_disabled.email_address)
-        reply.__setitem__('Content-Type', 'text/plain;')
-        reply.set_payload(self.ticket_data['description'])
+        reply = self._raw_message(
+            subject=self.ticket_data['title'],
+            from_email=submitter_email,
+            to_email=self.queue_public_with_notifications_disabled.email_address,
+            message_id=reply_message_id,
+            in_reply_to=message_id,
+        )
 
-        object_from_message(str(reply), self.queue_public_with_notifications_disabled, logger=logger)
+        object_from_message(reply, self.queue_public_with_notifications_disabled, logger=logger)
 
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
+        ticket = self._get_ticket_from_message_id(message_id)
         self.assertEqual(ticket.ticket_for_url, "mq2-%s" % ticket.id)
 
         # As an update was made, we increase the expected_email_count with:
@@ -984,75 +765,6 @@ class EmailInteractionsTestCase(TestCase):
         expected_email_count += 1
         self.assertEqual(expected_email_count, len(mail.outbox))
 
-    def test_create_followup_from_email_with_valid_message_id_with_original_cc_list_included(self):
-        """
-        Ensure that if a message is received with an valid In-Reply-To ID,
-        the expected <TicketCC> instances are created even if the there were
-        no <TicketCC>s so far.
-        """
-
-        # Ticket and TicketCCs creation #
-        msg = email.message.Message()
-
-        message_id = uuid.uuid4().hex
-        submitter_email = 'foo@bar.py'
-
-        msg.__setitem__('Message-ID', message_id)
-        msg.__setitem__('Subject', self.ticket_data['title'])
-        msg.__setitem__('From', submitter_email)
-        msg.__setitem__('To', self.queue_public.email_address)
-        msg.__setitem__('Content-Type', 'text/plain;')
-        msg.set_payload(self.ticket_data['description'])
-
-        email_count = len(mail.outbox)
-
-        object_from_message(str(msg), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-        # end of the Ticket and TicketCCs creation #
-
-        # Reply message
-        reply = email.message.Message()
-
-        reply_message_id = uuid.uuid4().hex
-        submitter_email = 'bravo@example.net'
-        cc_list = ['foo@bar.py', 'charlie@foobar.com']
-
-        reply.__setitem__('Message-ID', reply_message_id)
-        reply.__setitem__('In-Reply-To', message_id)
-        reply.__setitem__('Subject', self.ticket_data['title'])
-        reply.__setitem__('From', submitter_email)
-        reply.__setitem__('To', self.queue_public.email_address)
-        reply.__setitem__('Cc', ','.join(cc_list))
-        reply.__setitem__('Content-Type', 'text/plain;')
-        reply.set_payload(self.ticket_data['description'])
-
-        object_from_message(str(reply), self.queue_public, logger=logger)
-
-        followup = FollowUp.objects.get(message_id=message_id)
-        ticket = Ticket.objects.get(id=followup.ticket.id)
-        self.assertEqual(ticket.ticket_for_url, "mq1-%s" % ticket.id)
-
-        # Ensure that <TicketCC> is created
-        for cc_email in cc_list:
-            # Even after 2 messages with the same cc_list, <get> MUST return only
-            # one object
-            ticket_cc = TicketCC.objects.get(ticket=ticket, email=cc_email)
-            self.assertTrue(ticket_cc.ticket, ticket)
-            self.assertTrue(ticket_cc.email, cc_email)
-
-        # As we have created an Ticket from an email, we notify the sender (+1)
-        # and the new and update queues (+2)
-        expected_email_count = 1 + 2
-
-        # As an update was made, we increase the expected_email_count with:
-        # submitter: +1
-        # cc_list: +2
-        # public_update_queue: +1
-        expected_email_count += 1 + 2 + 1
-        self.assertEqual(expected_email_count, len(mail.outbox))
-
     def test_ticket_field_autofill(self):
         cat = KBCategory.objects.create(
             title="Test Cat",
@@ -1068,7 +780,7 @@ class EmailInteractionsTestCase(TestCase):
             answer="A KB Item",
         )
         self.kbitem1.save()
-        cat_url = reverse('helpdesk:submit') + "?kbitem=1;submitter_email=foo@bar.cz;title=lol;"
+        cat_url = reverse('helpdesk:submit') + "?kbitem=1&submitter_email=foo@bar.cz&title=lol"
         response = self.client.get(cat_url)
         self.assertContains(response, '<option value="1" selected>KBItem 1</option>')
         self.assertContains(response, '<input type="email" name="submitter_email" value="foo@bar.cz" class="form-control form-control" required id="id_submitter_email">')
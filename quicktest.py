@@ -68,6 +68,7 @@ class QuickDjangoTest(object):
 
     def __init__(self, *args, **kwargs):
         self.tests = args
+        self.parallel = kwargs.get('parallel', 1)
         self._tests()
 
     def _tests(self):
@@ -83,6 +84,11 @@ class QuickDjangoTest(object):
                     'PASSWORD': '',
                     'HOST': '',
                     'PORT': '',
+                    # Keep the test database in memory so the suite never
+                    # waits on disk I/O.
+                    'TEST': {
+                        'NAME': ':memory:',
+                    },
                 }
             },
             INSTALLED_APPS=self.INSTALLED_APPS,
@@ -95,7 +101,7 @@ class QuickDjangoTest(object):
         )
 
         from django.test.runner import DiscoverRunner
-        test_runner = DiscoverRunner(verbosity=1)
+        test_runner = DiscoverRunner(verbosity=1, parallel=self.parallel)
         django.setup()
 
         failures = test_runner.run_tests(self.tests)
@@ -116,7 +122,11 @@ if __name__ == '__main__':
         description="Run Django tests."
     )
     parser.add_argument('tests', nargs="*", type=str)
+    parser.add_argument(
+        '--parallel', type=int, default=1,
+        help="Run tests in the given number of parallel processes."
+    )
     args = parser.parse_args()
     if not args.tests:
         args.tests = ['helpdesk']
-    QuickDjangoTest(*args.tests)
+    QuickDjangoTest(*args.tests, parallel=args.parallel)